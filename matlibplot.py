@@ -1,3 +1,5 @@
+import matplotlib
+matplotlib.use("Agg")  # Headless backend; select before importing pyplot
 import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
@@ -11,65 +13,140 @@ colors = {
     'neutral': '#B0BEC5'    # Gray for backgrounds/inactive
 }
 
-# Create figure with 2x2 grid
-fig = plt.figure(figsize=(12, 10))
-# plt.style.use('seaborn')  # Comment out if Seaborn is not installed
-
-# Panel 1: Worker Role Relationships (Top Left)
-ax1 = plt.subplot(2, 2, 1)
-G = nx.DiGraph()
-workers = ["Librarian", "Inspector", "Foreman", "Shift Supervisor", "Diplomatic Corps"]
-G.add_edges_from([
-    ("Foreman", "Inspector"),
-    ("Inspector", "Librarian"),
-    ("Shift Supervisor", "Foreman"),
-    ("Diplomatic Corps", "Foreman"),
-    ("Diplomatic Corps", "Shift Supervisor"),
-])
-pos = nx.spring_layout(G)
-nx.draw(G, pos, with_labels=True, node_color=colors['active'], node_size=2000, 
-        font_weight='bold', arrowsize=20, edge_color=colors['neutral'], ax=ax1)
-ax1.set_title("Molecular UTM Worker Roles", fontsize=12, color=colors['data'])
-for node, (x, y) in pos.items():
-    ax1.text(x, y-0.1, f"80%", ha='center', va='top', color=colors['warning'], fontsize=10)
-
-# Panel 2: Benchmark Performance (Top Right)
-ax2 = plt.subplot(2, 2, 2)
-benchmarks = ['TSP', '3-SAT']
-times = [2.3, 3.7]  # Placeholder data
-bars = ax2.bar(benchmarks, times, color=[colors['aux'], colors['data']])
-ax2.set_ylabel('Execution Time (s)', color=colors['data'])
-ax2.set_title('Benchmark Performance', fontsize=12, color=colors['data'])
-for bar in bars:
-    height = bar.get_height()
-    ax2.text(bar.get_x() + bar.get_width()/2., height,
-             f'{height:.1f}s', ha='center', va='bottom', color=colors['neutral'])
-
-# Panel 3: Tape State Visualization (Bottom Left)
-ax3 = plt.subplot(2, 2, 3)
-tape_positions = np.arange(20)
-tape_data = np.zeros(20)
-tape_data[5:10] = 1  # Placeholder data
-ax3.plot(tape_positions, tape_data, drawstyle='steps-mid', color=colors['data'], lw=2)
-ax3.set_xlabel('Tape Position', color=colors['data'])
-ax3.set_ylabel('Symbol', color=colors['data'])
-ax3.set_title('Librarian Tape State', fontsize=12, color=colors['data'])
-ax3.axvline(x=10, color=colors['warning'], linestyle='--', label='Max Utilization')
-ax3.legend()
-
-# Panel 4: CRN Simulation (Bottom Right)
-ax4 = plt.subplot(2, 2, 4)
-time_points = np.arange(0, 60, 1)
-species_a = np.sin(time_points / 10) + 1  # Placeholder data
-species_b = np.cos(time_points / 10) + 1
-ax4.plot(time_points, species_a, label='Species A', color=colors['data'])
-ax4.plot(time_points, species_b, label='Species B', color=colors['aux'])
-ax4.set_xlabel('Time (seconds)', color=colors['data'])
-ax4.set_ylabel('Concentration', color=colors['data'])
-ax4.set_title('CRN Species Concentrations', fontsize=12, color=colors['data'])
-ax4.legend()
-
-# Adjust layout and save
-plt.tight_layout()
-plt.savefig('molecular_utm_visualization.png', dpi=300, bbox_inches='tight')
-plt.close()
\ No newline at end of file
+
+BENCHMARKS = ['TSP', '3-SAT']
+
+# Worker graph positions from nx.spring_layout(G, seed=42); the topology is
+# fixed, so the force-directed solver does not need to run on every render
+WORKER_POSITIONS = {
+    "Foreman": (0.427, 0.081),
+    "Inspector": (-0.331, -0.437),
+    "Librarian": (-1.0, -0.914),
+    "Shift Supervisor": (0.196, 0.638),
+    "Diplomatic Corps": (0.707, 0.631),
+}
+OUTPUT_PATH = 'molecular_utm_visualization.png'
+
+
+def placeholder_data():
+    """Sample values for each data-driven panel"""
+    tape_data = np.zeros(20)
+    tape_data[5:10] = 1
+    time_points = np.arange(0, 60, 1)
+    return {
+        'times': [2.3, 3.7],
+        'tape': tape_data,
+        'time_points': time_points,
+        'species_a': np.sin(time_points / 10) + 1,
+        'species_b': np.cos(time_points / 10) + 1,
+    }
+
+
+def build_dashboard():
+    """Create the 2x2 dashboard once and return (fig, artists) for later updates"""
+    # Create figure with 2x2 grid
+    fig = plt.figure(figsize=(12, 10))
+    # plt.style.use('seaborn-v0_8')  # 'seaborn' was renamed in Matplotlib 3.6
+
+    # Panel 1: Worker Role Relationships (Top Left)
+    ax1 = plt.subplot(2, 2, 1)
+    G = nx.DiGraph()
+    workers = ["Librarian", "Inspector", "Foreman", "Shift Supervisor", "Diplomatic Corps"]
+    G.add_edges_from([
+        ("Foreman", "Inspector"),
+        ("Inspector", "Librarian"),
+        ("Shift Supervisor", "Foreman"),
+        ("Diplomatic Corps", "Foreman"),
+        ("Diplomatic Corps", "Shift Supervisor"),
+    ])
+    pos = WORKER_POSITIONS
+    nx.draw(G, pos, with_labels=True, node_color=colors['active'], node_size=2000, 
+            font_weight='bold', arrowsize=20, edge_color=colors['neutral'], ax=ax1)
+    ax1.set_title("Molecular UTM Worker Roles", fontsize=12, color=colors['data'])
+    for node, (x, y) in pos.items():
+        ax1.text(x, y-0.1, f"80%", ha='center', va='top', color=colors['warning'], fontsize=10)
+
+    # Panel 2: Benchmark Performance (Top Right)
+    ax2 = plt.subplot(2, 2, 2)
+    bars = ax2.bar(BENCHMARKS, [0.0] * len(BENCHMARKS), color=[colors['aux'], colors['data']])
+    ax2.set_ylabel('Execution Time (s)', color=colors['data'])
+    ax2.set_title('Benchmark Performance', fontsize=12, color=colors['data'])
+    bar_labels = [
+        ax2.text(bar.get_x() + bar.get_width()/2., 0.0, '',
+                 ha='center', va='bottom', color=colors['neutral'])
+        for bar in bars
+    ]
+
+    # Panel 3: Tape State Visualization (Bottom Left)
+    ax3 = plt.subplot(2, 2, 3)
+    tape_line, = ax3.plot([], [], drawstyle='steps-mid', color=colors['data'], lw=2)
+    ax3.set_xlabel('Tape Position', color=colors['data'])
+    ax3.set_ylabel('Symbol', color=colors['data'])
+    ax3.set_title('Librarian Tape State', fontsize=12, color=colors['data'])
+    ax3.axvline(x=10, color=colors['warning'], linestyle='--', label='Max Utilization')
+    ax3.legend()
+
+    # Panel 4: CRN Simulation (Bottom Right)
+    ax4 = plt.subplot(2, 2, 4)
+    species_a, = ax4.plot([], [], label='Species A', color=colors['data'])
+    species_b, = ax4.plot([], [], label='Species B', color=colors['aux'])
+    ax4.set_xlabel('Time (seconds)', color=colors['data'])
+    ax4.set_ylabel('Concentration', color=colors['data'])
+    ax4.set_title('CRN Species Concentrations', fontsize=12, color=colors['data'])
+    ax4.legend()
+
+    # Layout is solved once here; updates only touch artist data
+    plt.tight_layout()
+
+    artists = {
+        'fig': fig,
+        'bars': bars,
+        'bar_labels': bar_labels,
+        'tape_line': tape_line,
+        'species_a': species_a,
+        'species_b': species_b,
+    }
+    return fig, artists
+
+
+def update_dashboard(artists, new_data, path=OUTPUT_PATH):
+    """Push new data into the cached artists and save the figure to path"""
+    if 'times' in new_data:
+        for bar, label, height in zip(artists['bars'], artists['bar_labels'], new_data['times']):
+            bar.set_height(height)
+            label.set_y(height)
+            label.set_text(f'{height:.1f}s')
+        _rescale(artists['bars'][0].axes)
+
+    if 'tape' in new_data:
+        tape_data = np.asarray(new_data['tape'])
+        artists['tape_line'].set_data(np.arange(len(tape_data)), tape_data)
+        _rescale(artists['tape_line'].axes)
+
+    if 'species_a' in new_data or 'species_b' in new_data:
+        for key in ('species_a', 'species_b'):
+            if key in new_data:
+                values = np.asarray(new_data[key])
+                time_points = new_data.get('time_points', np.arange(len(values)))
+                artists[key].set_data(time_points, values)
+        _rescale(artists['species_a'].axes)
+
+    fig = artists['fig']
+    fig.canvas.draw_idle()
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+
+
+def _rescale(ax):
+    ax.relim()
+    ax.autoscale_view()
+
+
+def main():
+    """Render the dashboard to molecular_utm_visualization.png"""
+    fig, artists = build_dashboard()
+    update_dashboard(artists, placeholder_data())
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()
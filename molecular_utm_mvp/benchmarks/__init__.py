@@ -5,8 +5,20 @@ Molecular UTM Benchmarks
 Benchmark suite for testing molecular UTM performance on various problems.
 """
 
-from .benchmark_runner import BenchmarkRunner
-from .tsp_benchmark import TSPBenchmark
-from .sat_benchmark import SATBenchmark
+import importlib
+
+# Exports are resolved on first access so importing one benchmark module
+# does not pull in the others
+_EXPORTS = {
+    "BenchmarkRunner": ".benchmark_runner",
+    "TSPBenchmark": ".tsp_benchmark",
+    "SATBenchmark": ".sat_benchmark",
+}
 
 __all__ = ["BenchmarkRunner", "TSPBenchmark", "SATBenchmark"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,70 @@
+"""
+Cache for generated CRN specifications
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+# Bump when the CRN text produced by the benchmarks changes
+CRN_FORMAT_VERSION = 1
+MAX_MEMORY_ENTRIES = 32
+# The disk tier is opt-in: CRN files can be tens of MB each and are never evicted
+CACHE_DIR = (
+    Path(os.environ["MOLECULAR_UTM_CACHE_DIR"]) if os.environ.get("MOLECULAR_UTM_CACHE_DIR") else None
+)
+
+_memory_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def cached_crn(problem: str, size: int, seed: Optional[int], instance: bytes,
+               build: Callable[[], str], variant: str = "") -> str:
+    """Return the CRN for a generated instance, calling build() on a cache miss
+    
+    Entries are keyed on a digest of the instance data itself rather than the
+    seed, since the random stream behind a seed can change between NumPy
+    releases. Seeded runs repeat, so their CRN text is kept in memory, and on
+    disk under CACHE_DIR when MOLECULAR_UTM_CACHE_DIR is set; unseeded
+    instances differ on every run and are always rebuilt. variant distinguishes
+    other options that change the text.
+    """
+    if seed is None:
+        return build()
+    
+    digest = hashlib.blake2b(instance, digest_size=16).hexdigest()
+    key = f"crn_{problem}_n{size}{variant}_{digest}_v{CRN_FORMAT_VERSION}"
+    with _lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+    
+    if CACHE_DIR is None:
+        crn_spec = build()
+    else:
+        path = CACHE_DIR / f"{key}.txt"
+        try:
+            crn_spec = path.read_text()
+        except OSError:
+            crn_spec = build()
+            _write(path, crn_spec)
+    
+    with _lock:
+        _memory_cache[key] = crn_spec
+        if len(_memory_cache) > MAX_MEMORY_ENTRIES:
+            _memory_cache.popitem(last=False)
+    return crn_spec
+
+
+def _write(path: Path, crn_spec: str):
+    """Write atomically; the disk cache is best effort"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(crn_spec)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
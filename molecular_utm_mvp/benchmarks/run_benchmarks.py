@@ -3,55 +3,77 @@
 Molecular UTM Benchmark Runner
 """
 
-import time
 import asyncio
+import time
 from pathlib import Path
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from molecular_utm_mvp.core import MolecularUTM, UTMConfig
-from benchmarks.tsp_benchmark import TSPBenchmark
-from benchmarks.sat_benchmark import SATBenchmark
 
+async def _timed_run(benchmark, problem_size):
+    """Run one benchmark off the event loop and time it"""
+    start = time.perf_counter_ns()
+    result = await benchmark.run_async(problem_size)
+    elapsed_ns = time.perf_counter_ns() - start
+    return {"result": result, "time": elapsed_ns / 1e9, "time_ns": elapsed_ns}
 
-def run_benchmark_suite(problem_type="all", problem_size=10, debug=False):
-    """Run the complete benchmark suite"""
+
+async def run_benchmark_suite_async(problem_type="all", problem_size=10, debug=False, seed=None):
+    """Run the selected benchmarks concurrently
+    
+    The benchmarks overlap in worker threads, so each reported time is the
+    wall-clock time of that benchmark while competing with the others, not
+    its time in isolation.
+    """
+    # Heavy imports are deferred so only the selected benchmarks are loaded
+    from molecular_utm_mvp.core import MolecularUTM, UTMConfig
+    
     print("🧬 Starting Molecular UTM Benchmark Suite")
     print("=" * 50)
     
     config = UTMConfig(debug_mode=debug)
-    utm = MolecularUTM(config)
     
-    results = {}
+    # Each benchmark gets its own UTM so concurrent runs share no state
+    runs = {}
     
     if problem_type in ["tsp", "all"]:
-        print(f"\n📍 Running TSP Benchmark (size={problem_size})")
-        tsp_benchmark = TSPBenchmark(utm)
-        tsp_start = time.time()
-        tsp_result = tsp_benchmark.run(problem_size)
-        tsp_time = time.time() - tsp_start
-        results["tsp"] = {"result": tsp_result, "time": tsp_time}
-        print(f"TSP completed in {tsp_time:.2f}s")
+        from benchmarks.tsp_benchmark import TSPBenchmark
+        
+        print(f"📍 [TSP] Starting benchmark (size={problem_size})")
+        tsp_benchmark = TSPBenchmark(MolecularUTM(config), seed=seed)
+        runs["tsp"] = _timed_run(tsp_benchmark, problem_size)
     
     if problem_type in ["3sat", "all"]:
-        print(f"\n🔧 Running 3-SAT Benchmark (size={problem_size})")
-        sat_benchmark = SATBenchmark(utm)
-        sat_start = time.time()
-        sat_result = sat_benchmark.run(problem_size)
-        sat_time = time.time() - sat_start
-        results["3sat"] = {"result": sat_result, "time": sat_time}
-        print(f"3-SAT completed in {sat_time:.2f}s")
+        from benchmarks.sat_benchmark import SATBenchmark
+        
+        print(f"🔧 [3-SAT] Starting benchmark (size={problem_size})")
+        sat_benchmark = SATBenchmark(MolecularUTM(config), seed=seed)
+        runs["3sat"] = _timed_run(sat_benchmark, problem_size)
+    
+    results = dict(zip(runs, await asyncio.gather(*runs.values())))
+    
+    if "tsp" in results:
+        print(f"TSP completed in {results['tsp']['time']:.2f}s")
+    if "3sat" in results:
+        print(f"3-SAT completed in {results['3sat']['time']:.2f}s")
     
     print("\n📊 Benchmark Results Summary:")
     print("=" * 30)
+    if len(results) > 1:
+        print("(times measured while benchmarks ran concurrently)")
     for benchmark_name, data in results.items():
         print(f"{benchmark_name.upper()}: {data['time']:.2f}s - {data['result']}")
     
     return results
 
 
+def run_benchmark_suite(problem_type="all", problem_size=10, debug=False, seed=None):
+    """Run the complete benchmark suite"""
+    return asyncio.run(run_benchmark_suite_async(problem_type, problem_size, debug, seed))
+
+
 if __name__ == "__main__":
     import argparse
     
@@ -59,6 +81,7 @@ if __name__ == "__main__":
     parser.add_argument('--problem', choices=['tsp', '3sat', 'all'], default='all')
     parser.add_argument('--size', type=int, default=10)
     parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--seed', type=int, default=None, help='RNG seed for reproducible instances')
     
     args = parser.parse_args()
-    run_benchmark_suite(args.problem, args.size, args.debug)
+    run_benchmark_suite(args.problem, args.size, args.debug, args.seed)
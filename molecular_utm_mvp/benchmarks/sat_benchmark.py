@@ -2,78 +2,174 @@
 3-SAT Problem Benchmark for Molecular UTM
 """
 
-import random
-from typing import List, Tuple
+import asyncio
+import functools
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .crn_cache import cached_crn
+
+WORD_BITS = 64
+
+Clause = Tuple[Tuple[int, bool], ...]
 
 
 class SATBenchmark:
     """3-SAT benchmark using molecular UTM approach"""
     
-    def __init__(self, molecular_utm):
+    name = "3-SAT"
+    
+    def __init__(self, molecular_utm, seed: Optional[int] = None):
         self.utm = molecular_utm
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
         self.variables = []
-        self.clauses = []
+        self.clauses_arr = np.empty((0, 3, 2), dtype=np.int32)
+        self._clauses = None
+        self.clause_masks = np.empty((0, 1), dtype=np.uint64)
+        self.clause_polarity = np.empty((0, 1), dtype=np.uint64)
     
     def generate_3sat_instance(self, num_vars: int, num_clauses: int = None):
         """Generate a random 3-SAT instance"""
         if num_clauses is None:
             num_clauses = int(4.3 * num_vars)  # Standard ratio for satisfiable instances
         
+        if num_vars < 3:
+            raise ValueError("3-SAT instances need at least 3 variables")
+        
         self.variables = [f"x{i}" for i in range(num_vars)]
-        self.clauses = []
-        
-        for _ in range(num_clauses):
-            # Create clause with 3 random literals
-            clause = []
-            selected_vars = random.sample(range(num_vars), 3)
-            
-            for var_idx in selected_vars:
-                # Randomly negate the variable
-                negated = random.choice([True, False])
-                clause.append((var_idx, negated))
-            
-            self.clauses.append(clause)
+        
+        # Draw 3 distinct variables per clause in O(num_clauses): pick each
+        # from a range one smaller than the last and shift it past earlier picks
+        first = self.rng.integers(0, num_vars, size=num_clauses)
+        second = self.rng.integers(0, num_vars - 1, size=num_clauses)
+        second += second >= first
+        third = self.rng.integers(0, num_vars - 2, size=num_clauses)
+        third += third >= np.minimum(first, second)
+        third += third >= np.maximum(first, second)
+        var_idx = np.stack((first, second, third), axis=1)
+        negated = self.rng.integers(0, 2, size=(num_clauses, 3), dtype=np.bool_)
+        
+        # Packed literals: [..., 0] is the variable index, [..., 1] the negation flag
+        self.clauses_arr = np.empty((num_clauses, 3, 2), dtype=np.int32)
+        self.clauses_arr[:, :, 0] = var_idx
+        self.clauses_arr[:, :, 1] = negated
+        self._clauses = None
+        self.pack_clauses()
+    
+    @property
+    def clauses(self) -> Tuple[Clause, ...]:
+        """Read-only (var_idx, negated) view of clauses_arr, built on first access
+        
+        The view is immutable because clauses_arr is the real store; assign to
+        clauses to replace them.
+        """
+        if self._clauses is None:
+            self._clauses = tuple(
+                tuple((v, bool(n)) for v, n in clause)
+                for clause in self.clauses_arr.tolist()
+            )
+        return self._clauses
+    
+    @clauses.setter
+    def clauses(self, clauses: Sequence[Sequence[Tuple[int, bool]]]):
+        self.clauses_arr = np.array(clauses, dtype=np.int32).reshape(-1, 3, 2)
+        self._clauses = None
+        self.pack_clauses()
+    
+    def pack_clauses(self):
+        """Build per-clause uint64 bitsets of literal variables and negations
+        
+        Bit v of word v // 64 in clause_masks is set for every variable v in
+        the clause, and the same bit in clause_polarity is set if that literal
+        is negated.
+        """
+        num_clauses = len(self.clauses_arr)
+        var_idx = self.clauses_arr[:, :, 0]
+        # Clauses may be assigned before variables, so size by both
+        num_bits = max(len(self.variables), int(var_idx.max()) + 1 if var_idx.size else 0)
+        num_words = max(1, -(-num_bits // WORD_BITS))
+        negated = self.clauses_arr[:, :, 1].astype(np.uint64)
+        
+        rows = np.broadcast_to(np.arange(num_clauses)[:, None], var_idx.shape)
+        words = var_idx // WORD_BITS
+        bits = np.left_shift(np.uint64(1), (var_idx % WORD_BITS).astype(np.uint64))
+        
+        self.clause_masks = np.zeros((num_clauses, num_words), dtype=np.uint64)
+        self.clause_polarity = np.zeros((num_clauses, num_words), dtype=np.uint64)
+        # Two literals of a clause may share a word, so accumulate with .at
+        np.bitwise_or.at(self.clause_masks, (rows, words), bits)
+        np.bitwise_or.at(self.clause_polarity, (rows, words), bits * negated)
+    
+    def pack_assignment(self, assignment: dict) -> np.ndarray:
+        """Pack a {var: bool} assignment into a little-endian uint64 bitset"""
+        num_words = self.clause_masks.shape[1]
+        values = np.fromiter(
+            (assignment.get(var, False) for var in self.variables),
+            dtype=np.uint8,
+            count=len(self.variables),
+        )
+        packed = np.zeros(num_words * 8, dtype=np.uint8)
+        # Variables beyond the clause masks cannot affect any clause
+        bits = np.packbits(values, bitorder="little")[:len(packed)]
+        packed[:len(bits)] = bits
+        return packed.view("<u8")
     
     def create_sat_crn(self) -> str:
         """Create CRN representation of 3-SAT problem"""
-        crn_spec = """-- 3-SAT Chemical Reaction Network
+        parts = ["""-- 3-SAT Chemical Reaction Network
 -- Variables represented as molecular species (TRUE/FALSE states)
 -- Clauses as reactions that must be satisfied
-
-"""
+"""]
         
         # Variable assignment reactions
         for var in self.variables:
-            crn_spec += f"{var}_false -> {var}_true, rate=1.0\n"
-            crn_spec += f"{var}_true -> {var}_false, rate=1.0\n"
+            parts.append(f"{var}_false -> {var}_true, rate=1.0")
+            parts.append(f"{var}_true -> {var}_false, rate=1.0")
         
-        crn_spec += "\n-- Clause satisfaction reactions\n"
+        parts.append("\n-- Clause satisfaction reactions")
         
         # Clause satisfaction reactions
-        for i, clause in enumerate(self.clauses):
-            reactants = []
+        variables = self.variables
+        for i, clause in enumerate(self.clauses_arr.tolist()):
+            # Clause is satisfied if at least one literal is true
+            literals = ", ".join(f"({var_idx}, {bool(negated)})" for var_idx, negated in clause)
+            parts.append(f"-- Clause {i+1}: [{literals}]")
             for var_idx, negated in clause:
-                var_name = self.variables[var_idx]
                 state = "false" if negated else "true"
-                reactants.append(f"{var_name}_{state}")
-            
-            # Clause is satisfied if at least one literal is true
-            crn_spec += f"-- Clause {i+1}: {clause}\n"
-            for reactant in reactants:
-                crn_spec += f"{reactant} -> clause_{i}_satisfied, rate=10.0\n"
+                parts.append(f"{variables[var_idx]}_{state} -> clause_{i}_satisfied, rate=10.0")
         
-        return crn_spec
+        parts.append("")
+        return "\n".join(parts)
     
-    def run(self, num_vars: int) -> dict:
-        """Run 3-SAT benchmark with specified number of variables"""
-        print(f"Generating 3-SAT instance with {num_vars} variables...")
+    def log(self, message: str):
+        """Print a progress line prefixed with the benchmark name
+        
+        The line is written in one call so concurrent benchmarks do not
+        interleave within a line.
+        """
+        print(f"[{self.name}] {message}\n", end="", flush=True)
+    
+    def run(self, num_vars: int, seed: Optional[int] = None) -> dict:
+        """Run 3-SAT benchmark with specified number of variables; seeded runs are reproducible"""
+        if seed is not None:
+            self.seed = seed
+        if self.seed is not None:
+            self.rng = np.random.default_rng(self.seed)
+        
+        self.log(f"Generating 3-SAT instance with {num_vars} variables...")
         self.generate_3sat_instance(num_vars)
         
-        print(f"Created {len(self.clauses)} clauses")
-        print("Creating CRN specification...")
-        crn_spec = self.create_sat_crn()
+        self.log(f"Created {len(self.clauses_arr)} clauses")
+        self.log("Creating CRN specification...")
+        crn_spec = cached_crn(
+            "sat", num_vars, self.seed,
+            self.clauses_arr.tobytes(),
+            lambda: self.create_sat_crn(),
+        )
         
-        print("Executing molecular 3-SAT solution...")
+        self.log("Executing molecular 3-SAT solution...")
         result = self.utm.execute_crn_string(crn_spec)
         
         # Extract satisfying assignment
@@ -82,34 +178,38 @@ class SATBenchmark:
         
         return {
             "variables": num_vars,
-            "clauses": len(self.clauses),
+            "clauses": len(self.clauses_arr),
             "satisfiable": is_satisfiable,
             "assignment": assignment,
             "execution_steps": result.get("steps", 0)
         }
     
+    async def run_async(self, num_vars: int, seed: Optional[int] = None) -> dict:
+        """Run the benchmark in a worker thread so other benchmarks can overlap"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.run, num_vars, seed))
+    
     def extract_assignment(self, utm_result) -> dict:
-        """Extract variable assignment from UTM execution result"""
-        # Simplified extraction - analyze molecular concentrations
-        assignment = {}
-        for var in self.variables:
-            assignment[var] = random.choice([True, False])  # Placeholder
-        return assignment
+        """Extract variable assignment from UTM execution result
+        
+        utm_result["concentrations"] is a (num_species,) float array whose first
+        2 * num_vars entries alternate x{i}_false, x{i}_true. A variable is True
+        when its _true species is more concentrated than its _false species.
+        """
+        num_vars = len(self.variables)
+        concentrations = utm_result.get("concentrations")
+        if concentrations is None:
+            # Placeholder until the UTM reports concentrations
+            values = self.rng.integers(0, 2, size=num_vars, dtype=np.bool_)
+        else:
+            states = np.asarray(concentrations, dtype=np.float32)[:2 * num_vars].reshape(num_vars, 2)
+            values = states[:, 1] > states[:, 0]
+        return dict(zip(self.variables, values.tolist()))
     
     def verify_assignment(self, assignment: dict) -> bool:
         """Verify if the assignment satisfies all clauses"""
-        for clause in self.clauses:
-            clause_satisfied = False
-            for var_idx, negated in clause:
-                var_name = self.variables[var_idx]
-                var_value = assignment.get(var_name, False)
-                
-                # Check if this literal satisfies the clause
-                if (not negated and var_value) or (negated and not var_value):
-                    clause_satisfied = True
-                    break
-            
-            if not clause_satisfied:
-                return False
-        
-        return True
+        # A literal holds when its variable bit differs from its negation bit,
+        # so a clause holds when any masked bit of (assignment ^ polarity) is set
+        assign_bits = self.pack_assignment(assignment)
+        literal_bits = (assign_bits ^ self.clause_polarity) & self.clause_masks
+        return bool(np.all(literal_bits.any(axis=1)))
@@ -2,63 +2,117 @@
 Traveling Salesman Problem (TSP) Benchmark for Molecular UTM
 """
 
-import random
-import math
-from typing import List, Tuple
+import asyncio
+import functools
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.spatial.distance import pdist, squareform
+
+from .crn_cache import cached_crn
+
+try:
+    from molecular_utm_mvp._kernels.tsp_kernel import path_distance as _path_distance
+except ModuleNotFoundError as exc:
+    # Compiled kernels are optional; only a missing build selects the NumPy path
+    if exc.name not in ("molecular_utm_mvp", "molecular_utm_mvp._kernels.tsp_kernel"):
+        raise
+    _path_distance = None
 
 
 class TSPBenchmark:
     """TSP benchmark using molecular UTM approach"""
     
-    def __init__(self, molecular_utm):
+    name = "TSP"
+    
+    def __init__(self, molecular_utm, seed: Optional[int] = None):
         self.utm = molecular_utm
-        self.cities = []
-        self.distance_matrix = []
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.condensed_distances = np.empty(0)
+        self.distance_matrix = np.empty((0, 0))
+        self.rate_matrix = sp.csr_matrix((0, 0))
+    
+    @property
+    def num_cities(self) -> int:
+        """Number of generated cities"""
+        return len(self.xs)
     
-    def generate_cities(self, n: int) -> List[Tuple[float, float]]:
-        """Generate n random cities"""
-        self.cities = [(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(n)]
-        return self.cities
+    def generate_cities(self, n: int) -> np.ndarray:
+        """Generate n random cities, stored as separate x and y coordinate arrays"""
+        self.xs = self.rng.uniform(0, 100, size=n)
+        self.ys = self.rng.uniform(0, 100, size=n)
+        return np.column_stack((self.xs, self.ys))
     
     def calculate_distance_matrix(self):
         """Calculate distance matrix between all cities"""
-        n = len(self.cities)
-        self.distance_matrix = [[0.0] * n for _ in range(n)]
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    x1, y1 = self.cities[i]
-                    x2, y2 = self.cities[j]
-                    distance = math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
-                    self.distance_matrix[i][j] = distance
+        # pdist only evaluates the upper triangle; squareform mirrors it
+        coords = np.column_stack((self.xs, self.ys))
+        self.condensed_distances = pdist(coords, metric="euclidean")
+        self.distance_matrix = squareform(self.condensed_distances)
+    
+    def calculate_rate_matrix(self, rate_threshold: float = 0.0):
+        """Calculate sparse city transition rates, dropping rates at or below rate_threshold"""
+        # Work on the condensed upper triangle; squareform mirrors it and
+        # leaves the diagonal (self-transitions) at zero
+        rates = 1.0 / (self.condensed_distances + 1.0)  # Shorter distances = higher rates
+        rates[rates <= rate_threshold] = 0.0
+        self.rate_matrix = sp.csr_matrix(squareform(rates))
     
     def create_tsp_crn(self, n: int) -> str:
-        """Create CRN representation of TSP problem"""
-        crn_spec = f"""
+        """Create CRN representation of TSP problem from the current rate matrix"""
+        parts = [f"""
 -- TSP Chemical Reaction Network for {n} cities
 -- Each city is represented as a molecular species
 
--- City selection reactions
-"""
+-- City selection reactions"""]
+        # One pass over the non-zero rates, row by row
+        indptr = self.rate_matrix.indptr.tolist()
+        indices = self.rate_matrix.indices.tolist()
+        rates = self.rate_matrix.data.tolist()
         for i in range(n):
-            for j in range(n):
-                if i != j:
-                    rate = 1.0 / (self.distance_matrix[i][j] + 1.0)  # Shorter distances = higher rates
-                    crn_spec += f"city_{i} -> city_{j}, rate={rate:.3f}\n"
+            for k in range(indptr[i], indptr[i + 1]):
+                parts.append(f"city_{i} -> city_{indices[k]}, rate={rates[k]:.3f}")
         
-        return crn_spec
+        parts.append("")
+        return "\n".join(parts)
     
-    def run(self, n: int) -> dict:
-        """Run TSP benchmark with n cities"""
-        print(f"Generating {n} cities...")
+    def log(self, message: str):
+        """Print a progress line prefixed with the benchmark name
+        
+        The line is written in one call so concurrent benchmarks do not
+        interleave within a line.
+        """
+        print(f"[{self.name}] {message}\n", end="", flush=True)
+    
+    def run(self, n: int, seed: Optional[int] = None, rate_threshold: float = 0.0) -> dict:
+        """Run TSP benchmark with n cities; seeded runs are reproducible
+        
+        Transitions with rate 1/(d+1) at or below rate_threshold are left out of the CRN.
+        """
+        if seed is not None:
+            self.seed = seed
+        if self.seed is not None:
+            self.rng = np.random.default_rng(self.seed)
+        
+        self.log(f"Generating {n} cities...")
         self.generate_cities(n)
         self.calculate_distance_matrix()
+        self.calculate_rate_matrix(rate_threshold)
         
-        print("Creating CRN specification...")
-        crn_spec = self.create_tsp_crn(n)
+        self.log("Creating CRN specification...")
+        variant = f"_t{rate_threshold}" if rate_threshold > 0 else ""
+        crn_spec = cached_crn(
+            "tsp", n, self.seed,
+            self.xs.tobytes() + self.ys.tobytes(),
+            lambda: self.create_tsp_crn(n),
+            variant=variant,
+        )
         
-        print("Executing molecular TSP solution...")
+        self.log("Executing molecular TSP solution...")
         # Use molecular UTM to solve TSP
         result = self.utm.execute_crn_string(crn_spec)
         
@@ -68,21 +122,59 @@ class TSPBenchmark:
         
         return {
             "cities": n,
-            "best_path": best_path,
+            "best_path": best_path.tolist(),
             "best_distance": best_distance,
             "execution_steps": result.get("steps", 0)
         }
     
-    def extract_best_path(self, utm_result) -> List[int]:
-        """Extract best path from UTM execution result"""
-        # Simplified extraction - in real implementation would analyze molecular concentrations
-        return list(range(len(self.cities)))  # Placeholder
+    async def run_async(self, n: int, seed: Optional[int] = None,
+                        rate_threshold: float = 0.0) -> dict:
+        """Run the benchmark in a worker thread so other benchmarks can overlap"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, n, seed, rate_threshold)
+        )
     
-    def calculate_path_distance(self, path: List[int]) -> float:
+    def extract_best_path(self, utm_result) -> np.ndarray:
+        """Extract best path from UTM execution result
+        
+        utm_result["concentrations"] is a (num_species,) float array whose first
+        n * n entries are the city_i -> city_j transition concentrations in
+        row-major order. The tour starts at city 0 and greedily follows the
+        most concentrated transition to an unvisited city.
+        """
+        n = self.num_cities
+        concentrations = utm_result.get("concentrations")
+        if concentrations is None:
+            return np.arange(n)  # Placeholder until the UTM reports concentrations
+        
+        transitions = np.asarray(concentrations, dtype=np.float32)[:n * n].reshape(n, n)
+        # Rank every row's successors once, highest concentration first
+        preferences = np.argsort(-transitions, axis=1)
+        
+        path = np.empty(n, dtype=np.intp)
+        visited = np.zeros(n, dtype=np.bool_)
+        city = 0
+        for step in range(n):
+            path[step] = city
+            visited[city] = True
+            if step < n - 1:
+                ranked = preferences[city]
+                city = ranked[~visited[ranked]][0]
+        return path
+    
+    def calculate_path_distance(self, path: Union[Sequence[int], np.ndarray]) -> float:
         """Calculate total distance of given path"""
-        total_distance = 0.0
-        for i in range(len(path)):
-            current_city = path[i]
-            next_city = path[(i + 1) % len(path)]
-            total_distance += self.distance_matrix[current_city][next_city]
-        return total_distance
+        path = np.asarray(path, dtype=np.intp)
+        num_cities = self.distance_matrix.shape[0]
+        # Validate here so NumPy (which wraps negatives) and the kernel agree
+        if path.size and (path.min() < 0 or path.max() >= num_cities):
+            raise IndexError(f"path contains a city index out of range for {num_cities} cities")
+        
+        if _path_distance is not None:
+            return _path_distance(
+                np.ascontiguousarray(self.distance_matrix, dtype=np.float64),
+                np.ascontiguousarray(path, dtype=np.intc),
+            )
+        
+        return float(self.distance_matrix[path, np.roll(path, -1)].sum())
@@ -1,5 +1,18 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Compiled kernels are opt-in: MOLECULAR_UTM_ENABLE_SPEEDUPS=1 pip install .
+ext_modules = []
+if os.environ.get("MOLECULAR_UTM_ENABLE_SPEEDUPS") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/molecular_utm_mvp/_kernels/*.pyx"],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+
 setup(
     name="molecular_utm_mvp",
     version="0.1.0",
@@ -7,10 +20,12 @@ setup(
     author="Research Team",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     install_requires=[
         "pylua_bioxen_vm_lib>=0.1.18",
         "asyncio",
-        "numpy",
+        "numpy>=1.21",
+        "scipy",
         "networkx",
         "matplotlib",
         "pyyaml",
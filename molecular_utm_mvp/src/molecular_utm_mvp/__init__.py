@@ -8,9 +8,16 @@ A prototype implementation using pylua_bioxen_vm_lib with social role personific
 __version__ = "0.1.0"
 __author__ = "Research Team"
 
-from .core import MolecularUTM, UTMConfig
-from .workers import WorkerRegistry
-from .crn_engine import CRNEngine
+import importlib
+
+# Exports are resolved on first access so submodules such as _kernels can be
+# imported without loading the full UTM stack
+_EXPORTS = {
+    "MolecularUTM": ".core",
+    "UTMConfig": ".core",
+    "WorkerRegistry": ".workers",
+    "CRNEngine": ".crn_engine",
+}
 
 __all__ = [
     "MolecularUTM",
@@ -18,3 +25,9 @@ __all__ = [
     "WorkerRegistry",
     "CRNEngine",
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
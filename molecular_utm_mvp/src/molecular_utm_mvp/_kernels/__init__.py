@@ -0,0 +1,7 @@
+"""
+Compiled Kernels
+================
+
+Optional Cython kernels for benchmark hot loops. Pure-Python callers fall
+back to NumPy when the extensions have not been built.
+"""
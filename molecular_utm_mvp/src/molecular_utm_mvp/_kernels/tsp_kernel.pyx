@@ -0,0 +1,34 @@
+# cython: language_level=3
+"""
+Compiled TSP path-distance kernel
+"""
+
+
+cpdef double path_distance(double[:, ::1] D, int[::1] path) except? -1.0:
+    """Total length of the closed tour visiting path in order"""
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = path.shape[0]
+    cdef Py_ssize_t num_cities = D.shape[0]
+    cdef Py_ssize_t bad = -1
+    cdef double total = 0.0
+
+    if D.shape[1] != num_cities:
+        raise ValueError("distance matrix must be square")
+    if n == 0:
+        return total
+
+    with nogil:
+        # Built with boundscheck/wraparound off, so reject bad cities up front
+        for i in range(n):
+            if path[i] < 0 or path[i] >= num_cities:
+                bad = i
+                break
+
+        if bad < 0:
+            for i in range(n - 1):
+                total += D[path[i], path[i + 1]]
+            total += D[path[n - 1], path[0]]
+
+    if bad >= 0:
+        raise IndexError(f"city index {path[bad]} is out of range for {num_cities} cities")
+    return total
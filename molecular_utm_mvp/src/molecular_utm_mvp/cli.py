@@ -4,13 +4,9 @@ Command-line interface for Molecular UTM MVP
 """
 
 import click
-import asyncio
 import sys
 from pathlib import Path
 
-from .core import MolecularUTM, UTMConfig
-from .benchmarks import run_benchmark_suite
-
 
 @click.group()
 @click.option('--debug/--no-debug', default=False, help='Enable debug mode')
@@ -29,10 +25,13 @@ def main(ctx, debug, config):
 @click.pass_context
 def run_crn(ctx, crn_file, async_mode):
     """Execute a Chemical Reaction Network file"""
+    from .core import MolecularUTM, UTMConfig
+    
     config = UTMConfig(debug_mode=ctx.obj['debug'])
     utm = MolecularUTM(config)
     
     if async_mode:
+        import asyncio
         asyncio.run(utm.execute_crn_async(crn_file))
     else:
         utm.execute_crn_sync(crn_file)
@@ -41,10 +40,13 @@ def run_crn(ctx, crn_file, async_mode):
 @main.command()
 @click.option('--problem', type=click.Choice(['tsp', '3sat', 'all']), default='all')
 @click.option('--size', type=int, default=10, help='Problem size')
+@click.option('--seed', type=int, default=None, help='RNG seed for reproducible instances')
 @click.pass_context
-def benchmark(ctx, problem, size):
+def benchmark(ctx, problem, size, seed):
     """Run benchmark suite"""
-    run_benchmark_suite(problem, size, debug=ctx.obj['debug'])
+    from .benchmarks import run_benchmark_suite
+    
+    run_benchmark_suite(problem, size, debug=ctx.obj['debug'], seed=seed)
 
 
 @main.command()
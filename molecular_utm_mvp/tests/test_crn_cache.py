@@ -0,0 +1,72 @@
+"""
+Unit tests for the CRN specification cache
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import crn_cache
+from benchmarks.crn_cache import cached_crn
+
+
+class TestCRNCache(unittest.TestCase):
+    """Test memory and disk caching of CRN text"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp_dir.name)
+        patcher = mock.patch.object(crn_cache, "CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(crn_cache._memory_cache.clear)
+        crn_cache._memory_cache.clear()
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return f"crn build {self.builds}"
+
+    def test_hit_on_identical_instance(self):
+        """Test an identical instance is served from memory, then from disk"""
+        first = cached_crn("tsp", 5, 1, b"instance", self.build)
+        self.assertEqual(cached_crn("tsp", 5, 1, b"instance", self.build), first)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+        crn_cache._memory_cache.clear()
+        self.assertEqual(cached_crn("tsp", 5, 1, b"instance", self.build), first)
+        self.assertEqual(self.builds, 1)
+
+    def test_miss_on_changed_instance_or_variant(self):
+        """Test different instance bytes or threshold variant rebuild"""
+        cached_crn("tsp", 5, 1, b"instance", self.build)
+        cached_crn("tsp", 5, 1, b"other instance", self.build)
+        cached_crn("tsp", 5, 1, b"instance", self.build, variant="_t0.02")
+        self.assertEqual(self.builds, 3)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 3)
+
+    def test_unseeded_runs_bypass_cache(self):
+        """Test unseeded runs always rebuild and write nothing"""
+        cached_crn("sat", 5, None, b"instance", self.build)
+        cached_crn("sat", 5, None, b"instance", self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+        self.assertEqual(len(crn_cache._memory_cache), 0)
+
+    def test_disk_tier_is_opt_in(self):
+        """Test nothing is written to disk without a cache directory"""
+        with mock.patch.object(crn_cache, "CACHE_DIR", None):
+            first = cached_crn("tsp", 5, 1, b"instance", self.build)
+            self.assertEqual(cached_crn("tsp", 5, 1, b"instance", self.build), first)
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
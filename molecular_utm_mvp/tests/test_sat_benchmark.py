@@ -0,0 +1,106 @@
+"""
+Unit tests for the 3-SAT benchmark
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.sat_benchmark import SATBenchmark
+
+
+class TestSATInstanceGeneration(unittest.TestCase):
+    """Test random 3-SAT instance generation"""
+
+    def setUp(self):
+        self.benchmark = SATBenchmark(None, seed=0)
+
+    def test_clause_shape_and_default_ratio(self):
+        """Test clauses are packed as (num_clauses, 3, 2) int32"""
+        self.benchmark.generate_3sat_instance(50)
+        self.assertEqual(self.benchmark.clauses_arr.shape, (215, 3, 2))
+        self.assertEqual(self.benchmark.clauses_arr.dtype, np.int32)
+
+    def test_clause_variables_distinct_and_in_range(self):
+        """Test each clause uses 3 distinct variables, including at num_vars=3"""
+        for num_vars in (3, 4, 10, 200):
+            self.benchmark.generate_3sat_instance(num_vars, num_clauses=2000)
+            var_idx = self.benchmark.clauses_arr[:, :, 0]
+            self.assertTrue(((var_idx >= 0) & (var_idx < num_vars)).all())
+            self.assertTrue((np.sort(var_idx, axis=1)[:, 1:] != np.sort(var_idx, axis=1)[:, :-1]).all())
+            self.assertTrue(np.isin(self.benchmark.clauses_arr[:, :, 1], (0, 1)).all())
+
+    def test_too_few_variables(self):
+        """Test instances need at least 3 variables"""
+        with self.assertRaises(ValueError):
+            self.benchmark.generate_3sat_instance(2)
+
+
+class TestSATClauseView(unittest.TestCase):
+    """Test the legacy clauses view over the packed clause array"""
+
+    def setUp(self):
+        self.benchmark = SATBenchmark(None, seed=0)
+
+    def test_clauses_view_is_immutable(self):
+        """Test the clauses view cannot drift from clauses_arr"""
+        self.benchmark.generate_3sat_instance(10)
+        clauses = self.benchmark.clauses
+        self.assertEqual(len(clauses), len(self.benchmark.clauses_arr))
+        with self.assertRaises(AttributeError):
+            clauses.append(((0, False), (1, False), (2, False)))
+        with self.assertRaises(TypeError):
+            clauses[0][0] = (1, True)
+
+    def test_clauses_setter_before_variables(self):
+        """Test assigning clauses with wide indices before variables"""
+        self.benchmark.clauses = [[(0, True), (70, False), (2, True)]]
+        self.assertEqual(self.benchmark.clauses_arr.shape, (1, 3, 2))
+        self.benchmark.variables = [f"x{i}" for i in range(130)]
+        self.assertTrue(self.benchmark.verify_assignment({"x70": True}))
+        self.assertFalse(self.benchmark.verify_assignment({"x0": True, "x2": True}))
+
+
+def reference_verify(benchmark, assignment):
+    """Plain-Python clause check matching the original nested loop"""
+    for clause in benchmark.clauses:
+        if not any(assignment.get(benchmark.variables[var_idx], False) != negated
+                   for var_idx, negated in clause):
+            return False
+    return True
+
+
+class TestSATVerification(unittest.TestCase):
+    """Test bit-packed assignment verification"""
+
+    def test_matches_reference_at_word_boundaries(self):
+        """Test bitset verification across the 64-variable word boundary"""
+        rng = np.random.default_rng(0)
+        benchmark = SATBenchmark(None, seed=1)
+        for num_vars in (3, 63, 64, 65, 130):
+            for _ in range(100):
+                benchmark.generate_3sat_instance(num_vars, num_clauses=int(rng.integers(0, 8)))
+                values = rng.integers(0, 2, size=num_vars).astype(bool).tolist()
+                assignment = dict(zip(benchmark.variables, values))
+                self.assertEqual(
+                    benchmark.verify_assignment(assignment),
+                    reference_verify(benchmark, assignment),
+                )
+
+    def test_last_variable_of_each_word(self):
+        """Test clauses hinging on bits 62, 63 and 64 specifically"""
+        benchmark = SATBenchmark(None)
+        benchmark.variables = [f"x{i}" for i in range(65)]
+        for var_idx in (62, 63, 64):
+            benchmark.clauses = [[(var_idx, False), (0, False), (1, False)]]
+            self.assertTrue(benchmark.verify_assignment({f"x{var_idx}": True}))
+            self.assertFalse(benchmark.verify_assignment({f"x{var_idx}": False}))
+
+
+if __name__ == '__main__':
+    unittest.main()
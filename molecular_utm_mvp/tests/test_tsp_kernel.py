@@ -0,0 +1,60 @@
+"""
+Unit tests for the compiled TSP path-distance kernel
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add project root and src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import benchmarks.tsp_benchmark as tsp_module
+from benchmarks.tsp_benchmark import TSPBenchmark
+
+
+class TestTSPPathDistance(unittest.TestCase):
+    """Test the compiled kernel against the NumPy fallback"""
+
+    def setUp(self):
+        self.benchmark = TSPBenchmark(None, seed=0)
+        self.benchmark.generate_cities(12)
+        self.benchmark.calculate_distance_matrix()
+
+    def numpy_distance(self, path):
+        with mock.patch.object(tsp_module, "_path_distance", None):
+            return self.benchmark.calculate_path_distance(path)
+
+    @unittest.skipIf(tsp_module._path_distance is None, "compiled kernels not built")
+    def test_kernel_matches_numpy(self):
+        """Test kernel and NumPy fallback agree on valid paths"""
+        rng = np.random.default_rng(1)
+        for path in ([], [3], rng.permutation(12), rng.integers(0, 12, size=30)):
+            self.assertAlmostEqual(
+                self.benchmark.calculate_path_distance(path),
+                self.numpy_distance(path),
+            )
+
+    @unittest.skipIf(tsp_module._path_distance is None, "compiled kernels not built")
+    def test_kernel_rejects_out_of_range_city(self):
+        """Test the kernel raises instead of reading outside the matrix"""
+        D = np.ascontiguousarray(self.benchmark.distance_matrix)
+        for bad in (12, -1):
+            with self.assertRaises(IndexError):
+                tsp_module._path_distance(D, np.array([0, bad, 1], dtype=np.intc))
+
+    def test_out_of_range_city_raises(self):
+        """Test both backends reject out-of-range and negative cities"""
+        for bad in (12, -1):
+            with self.assertRaises(IndexError):
+                self.benchmark.calculate_path_distance([0, bad, 1])
+            with self.assertRaises(IndexError):
+                self.numpy_distance([0, bad, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()